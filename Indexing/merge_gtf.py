@@ -1,8 +1,15 @@
 from dataclasses import dataclass, fields
 from functools import reduce
 import argparse
+import mmap
 
-@dataclass(frozen=True)
+def header_end_offset(mm) -> int:
+    offset = 0
+    for _ in range(5):
+        offset = mm.find(b"\n", offset) + 1
+    return offset
+
+@dataclass(frozen=True, slots=True)
 class GTF_File_Header:
     description: str
     provider: str
@@ -20,43 +27,54 @@ class GTF_File_Header:
             date = add_header_attr("date"),
         )
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GTF_File:
     header: GTF_File_Header
-    body: list[str]
+    body_paths: list[str]
 
     def __add__(self, other):
         header = self.header + other.header
-        body = self.body + other.body
-        return GTF_File(header, body)
+        body_paths = self.body_paths + other.body_paths
+        return GTF_File(header, body_paths)
+
+    @classmethod
+    def concat(cls, gtf_files):
+        header = reduce(lambda a, b: a + b, (gtf.header for gtf in gtf_files))
+        body_paths = []
+        for gtf in gtf_files:
+            body_paths.extend(gtf.body_paths)
+        return cls(header=header, body_paths=body_paths)
 
     @classmethod
     def from_filepath(cls, filepath: str):
-        with open(filepath, "r") as file:
-            file_list = list(file)
-            header = GTF_File_Header(
-                description=file_list[0][2:-1],
-                provider=file_list[1][2:-1],
-                contact=file_list[2][2:-1],
-                format=file_list[3][2:-1],
-                date=file_list[4][2:-1],
-            )
-            body = file_list[5:]
-        return cls(header=header, body=body)
+        with open(filepath, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                header_lines = mm[:header_end_offset(mm)].decode().splitlines()
+        header = GTF_File_Header(
+            description=header_lines[0][2:],
+            provider=header_lines[1][2:],
+            contact=header_lines[2][2:],
+            format=header_lines[3][2:],
+            date=header_lines[4][2:],
+        )
+        return cls(header=header, body_paths=[filepath])
 
     def print_to_file(self, filename: str):
         if filename == None:
             filename = "concatenated.gtf"
-        with open(filename, 'w') as file:
-            for field in fields(self.header):
-                value = getattr(self.header, field.name)
-                file.write(f"##{value}\n")
-            for line in self.body:
-                file.write(f"{line}")
+        with open(filename, 'wb', buffering=1 << 20) as file:
+            file.writelines(
+                f"##{getattr(self.header, field.name)}\n".encode()
+                for field in fields(self.header)
+            )
+            for path in self.body_paths:
+                with open(path, "rb") as source:
+                    with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        file.write(memoryview(mm)[header_end_offset(mm):])
 
 def main(args):
     gtf_files = list(map(GTF_File.from_filepath, args.filepaths))
-    output_file = reduce(lambda a, b: a + b, gtf_files)
+    output_file = GTF_File.concat(gtf_files)
     output_file.print_to_file(filename=args.output)
 
 if __name__ == "__main__":
@@ -65,6 +83,3 @@ if __name__ == "__main__":
     parser.add_argument("-o", "--output", help="Name of the output file")
     args = parser.parse_args()
     main(args)
-
-
-